@@ -21,11 +21,11 @@ Controls:
 
 import sys
 import time
-import math
-from array import array
 from dataclasses import dataclass
+from math import gcd
 from typing import Optional
 
+import numpy as np
 import pygame
 
 
@@ -40,7 +40,6 @@ import pygame
 
 # Fullscreen resolution
 RESOLUTION = (1920, 1080)
-FPS = 60
 
 # Menu durations in seconds (label, seconds)
 GAME_OPTIONS = [
@@ -56,13 +55,36 @@ FINAL_PHASE_SECONDS = 5 * 60
 SHOT_CLOCK_NORMAL_SECONDS = 15
 SHOT_CLOCK_FINAL_SECONDS = 10
 
+# FrameController measures run time in integer nanoseconds (time.monotonic_ns)
+NS_PER_SECOND = 1_000_000_000
+
 # Audio configuration (beep generation is done in-code; no audio files required)
 AUDIO_ENABLED = True
-SAMPLE_RATE = 44100
+# An 880 Hz beep has nothing near the 11 kHz Nyquist limit of 22050 Hz, so the
+# lower rate is inaudible here and halves the PCM (and mixing work) per beep.
+SAMPLE_RATE = 22050
+# Mixer buffer in samples. Latency is MIXER_BUFFER / SAMPLE_RATE (~46 ms here):
+# inaudible for a countdown cue, but enough headroom that a busy Pi doesn't
+# underrun (crackles / "out of buffers") the way it could with ~12 ms.
+MIXER_BUFFER = 1024
+# Mixer sample format: 8-bit unsigned. A single 880 Hz sine loses nothing
+# audible at 8 bits (~48 dB SNR), and it halves every beep buffer and the
+# data the mixer moves. Tones are synthesized as int16 and packed on output.
+MIXER_SIZE = 8
 BEEP_FREQ_HZ = 880
 BEEP_SHORT_MS = 120
 BEEP_LONG_MS = 3000
 BEEP_VOLUME = 0.6
+BEEP_COUNTDOWN_FROM = 5  # short beeps at 5..1, long beep at 0
+# The long beep is played as a short seamless loop repeated on a reserved
+# mixer channel, so no 3 s buffer is ever held in memory
+BEEP_LOOP_MS = 100
+
+# The start/stop fob sends a key with no pygame keycode; match its raw scancode
+FOB_SCANCODE = 128
+# Repeat fob presses closer together than this are switch bounce (or a held
+# button) and are ignored, so one press can never start and stop a run
+FOB_DEBOUNCE_NS = 150_000_000
 
 # Basic palette
 COLORS = {
@@ -78,9 +100,10 @@ COLORS = {
 
 # ============================================================
 # UTILITY FUNCTIONS
-# - Formatting seconds -> MM:SS
+# - Formatting seconds -> MM:SS (plus a precomputed table)
 # - Draw centered text
-# - Generate beep sounds (sine wave buffer)
+# - Pre-rendered glyph tiles for the clocks
+# - Generate beep sounds (sine wave buffer, rendered once at import)
 # ============================================================
 
 def fmt_time(total_seconds: int) -> str:
@@ -94,49 +117,180 @@ def fmt_time(total_seconds: int) -> str:
     return f"{m:02d}:{s:02d}"
 
 
+# fmt_time() of every value the frame timer can show (0..longest frame),
+# so the draw path indexes a table instead of building a string per second
+FMT_TIME = tuple(fmt_time(n) for n in range(max(seconds for _, seconds in GAME_OPTIONS) + 1))
+
+
+def render_text(font, text, color) -> pygame.Surface:
+    """
+    Render text, convert_alpha()'d to the display's pixel format so blitting
+    it is a straight copy (needs the display mode to be set).
+    All UI text is rendered once at startup into pre-baked surfaces.
+    """
+    return font.render(text, True, color).convert_alpha()
+
+
 def draw_centered_text(surface, font, text, center, color):
     """
     Render text and blit it to the surface centered at (x, y).
-    This is how all text is placed in the UI.
+    Used while pre-baking the backgrounds and buttons.
     """
-    img = font.render(text, True, color)
-    rect = img.get_rect(center=center)
-    surface.blit(img, rect)
+    img = render_text(font, text, color)
+    surface.blit(img, img.get_rect(center=center))
+
+
+# Every character the two clocks can show (MM:SS and SS)
+GLYPH_CHARS = "0123456789:"
 
 
-def make_tone_sound(freq_hz: int, duration_ms: int, volume: float) -> pygame.mixer.Sound:
+def render_glyph_tiles(font, color) -> dict:
     """
-    Generate a mono sine tone and return it as a pygame Sound object.
+    Render each clock character once into its own surface (char -> surface).
+    The clocks are then composed from these tiles, so the huge timer fonts
+    are never rasterized again after startup.
+    """
+    return {ch: font.render(ch, True, color).convert_alpha() for ch in GLYPH_CHARS}
+
+
+def layout_glyphs(tiles, text, center) -> tuple:
+    """
+    Lay text out tile by tile, side by side, centered at (x, y).
+    Returns (blits, rect): the (tile, (x, y)) pairs to pass to
+    Surface.blits(), and the rect covered by the whole string.
+    """
+    glyphs = [tiles[ch] for ch in text]
+    width = sum(g.get_width() for g in glyphs)
+    height = max(g.get_height() for g in glyphs)
+    rect = pygame.Rect(0, 0, width, height)
+    rect.center = center
+
+    blits = []
+    x = rect.left
+    for g in glyphs:
+        blits.append((g, (x, rect.top)))
+        x += g.get_width()
+    return tuple(blits), rect
+
+
+def layout_centered(surf, center) -> tuple:
+    """Single-surface counterpart of layout_glyphs: ((surf, rect),), rect."""
+    rect = surf.get_rect(center=center)
+    return ((surf, rect),), rect
+
+
+# One period of a full-scale sine, built once at import.
+# The table length is chosen so BEEP_FREQ_HZ lands on whole table steps,
+# which makes the lookup below exact for the beep frequency.
+SINE_TABLE_LEN = SAMPLE_RATE // gcd(SAMPLE_RATE, BEEP_FREQ_HZ)
+_SINE_TABLE = (32767 * np.sin(2.0 * np.pi * np.arange(SINE_TABLE_LEN) / SINE_TABLE_LEN)).astype(np.int16)
+
+
+def _fade_len(n_samples: int) -> int:
+    """
+    Fade-in/out length in samples used for every tone (to avoid clicks).
+    Never 0, so the envelope can always divide by it.
+    """
+    return max(1, min(200, n_samples // 10))
+
+
+def _wavetable_tone(freq_hz: int, n_samples: int, volume: float) -> tuple:
+    """
+    The shared start of every tone: n_samples of a full-scale freq_hz sine,
+    read out of _SINE_TABLE by phase index, and volume clamped to 0..1 as a
+    Q15 level (32767 == 1.0). Returns (wave, level).
+    """
+    idx = (np.arange(n_samples) * freq_hz * SINE_TABLE_LEN // SAMPLE_RATE) % SINE_TABLE_LEN
+    return _SINE_TABLE[idx], int(32767 * max(0.0, min(1.0, volume)))
+
+
+def make_tone_samples(freq_hz: int, duration_ms: int, volume: float) -> np.ndarray:
+    """
+    Generate a mono sine tone and return it as 16-bit PCM samples.
 
     Why:
     - Avoid shipping audio files.
     - Keep beeps deterministic.
 
     Mechanism:
-    - Create a 16-bit PCM buffer (array('h')).
-    - Fill it with a sine wave at freq_hz.
-    - Apply a small fade-in/out to avoid clicks.
+    - Read the sine wave out of the precomputed _SINE_TABLE by phase index
+      (no per-sample sin() evaluation, so startup stays quick on a Pi).
+    - Multiply by a linear fade-in/out envelope to avoid clicks. The envelope
+      is Q15 fixed point (32767 == 1.0, volume folded in), so it is applied
+      with an integer multiply + shift instead of float conversions.
     """
     n_samples = int(SAMPLE_RATE * (duration_ms / 1000.0))
-    amp = int(32767 * max(0.0, min(1.0, volume)))
-    buf = array("h")
-    step = (2.0 * math.pi * freq_hz) / SAMPLE_RATE
+    fade = _fade_len(n_samples)
+    wave, level = _wavetable_tone(freq_hz, n_samples, volume)
+
+    # Fade to reduce click noise at start/end (same min(i, n - i, fade) ramp)
+    i = np.arange(n_samples)
+    env_q15 = (np.minimum(np.minimum(i, n_samples - i), fade) * level // fade).astype(np.int16)
+
+    # int32 intermediate so the Q15 product can't overflow
+    return ((wave.astype(np.int32) * env_q15) >> 15).astype(np.int16)
 
-    # Fade to reduce click noise at start/end
-    fade = min(200, n_samples // 10)  # in samples
-    for i in range(n_samples):
-        v = math.sin(step * i)
-        sample = int(amp * v)
 
-        if fade > 0:
-            if i < fade:
-                sample = int(sample * (i / fade))
-            elif i > n_samples - fade:
-                sample = int(sample * ((n_samples - i) / fade))
+def _fade_out_tail(samples: np.ndarray) -> None:
+    """Apply the standard linear fade-out to the tail of samples, in place."""
+    fade = _fade_len(len(samples))
+    ramp_q15 = np.arange(fade, 0, -1) * 32767 // fade
+    samples[-fade:] = (samples[-fade:].astype(np.int32) * ramp_q15) >> 15
 
-        buf.append(sample)
 
-    return pygame.mixer.Sound(buffer=buf.tobytes())
+# Long beep layout: the loop is a whole number of wavetable lengths as close to
+# BEEP_LOOP_MS as possible. SINE_TABLE_LEN samples hold a whole number of
+# BEEP_FREQ_HZ cycles, so the loop repeats without a click. The beep is
+# BEEP_LONG_SEGMENTS loops, the last one faded out.
+BEEP_LOOP_SAMPLES = SINE_TABLE_LEN * max(1, round(SAMPLE_RATE * BEEP_LOOP_MS / 1000 / SINE_TABLE_LEN))
+BEEP_LONG_SEGMENTS = max(2, round(SAMPLE_RATE * BEEP_LONG_MS / 1000 / BEEP_LOOP_SAMPLES))
+# Fade-in of the long beep, applied by the mixer (same length as make_tone_samples')
+BEEP_LONG_FADE_IN_MS = max(1, round(_fade_len(int(SAMPLE_RATE * BEEP_LONG_MS / 1000)) * 1000 / SAMPLE_RATE))
+
+
+def to_mixer_pcm(samples: np.ndarray) -> bytes:
+    """
+    Pack int16 tone samples into the mixer's MIXER_SIZE format:
+    unsigned 8-bit (top byte, offset by 128), or the int16 bytes as-is.
+    """
+    if MIXER_SIZE == 8:
+        return ((samples >> 8) + 128).astype(np.uint8).tobytes()
+    return samples.tobytes()
+
+
+def _prepare_short_beep():
+    """
+    Render the short beep PCM once, at module import.
+
+    SpeedSnookerUI only wraps these bytes in a pygame Sound, so no tone
+    synthesis happens while the UI is starting up and the first beep has
+    no synthesis latency.
+    Returns the PCM bytes, or None when audio is disabled.
+    """
+    if not AUDIO_ENABLED:
+        return None
+    return to_mixer_pcm(make_tone_samples(BEEP_FREQ_HZ, BEEP_SHORT_MS, BEEP_VOLUME))
+
+
+_BEEP_SHORT_PCM = _prepare_short_beep()
+
+
+def render_long_beep_pcm():
+    """
+    Render the long beep's two pieces: its steady loop segment and a copy of
+    it with the standard fade-out (the tail). The full beep is never rendered.
+    The sine comes from _wavetable_tone, like make_tone_samples'.
+    Returns (loop_pcm, tail_pcm).
+    """
+    wave, level = _wavetable_tone(BEEP_FREQ_HZ, BEEP_LOOP_SAMPLES, BEEP_VOLUME)
+    loop_arr = ((wave.astype(np.int32) * level) >> 15).astype(np.int16)
+    tail_arr = loop_arr.copy()
+    _fade_out_tail(tail_arr)
+    return to_mixer_pcm(loop_arr), to_mixer_pcm(tail_arr)
+
+
+def _no_sound() -> None:
+    """Beep hook used when audio is disabled or the mixer failed to start."""
 
 
 # ============================================================
@@ -169,8 +323,11 @@ class FrameController:
     - running: whether the shot run is active (both timers ticking)
 
     Timing strategy:
-    - Use time.monotonic() + fractional accumulation
-    - Decrement timers in whole seconds (stable and predictable)
+    - The UI drives the countdown from a 1 Hz SDL timer that runs only
+      while a shot run is active (see TICK_EVENT)
+    - Each tick consumes the whole seconds elapsed since the run started
+      (time.monotonic_ns(), integer nanoseconds) that have not been counted
+      yet, so a late or coalesced timer event can never make the countdown drift
     """
 
     def __init__(self, frame_total_seconds: int):
@@ -183,22 +340,21 @@ class FrameController:
         # True only during an active "shot run"
         self.running = False
 
-        # Time tracking for stable countdown
-        self._last_tick = time.monotonic()
-        self._accum = 0.0
+        # Length of the next shot: 15 seconds, or 10 once the frame is in its
+        # last 5 minutes. frame_remaining only falls, so this flips at most once.
+        self._shot_length = (
+            SHOT_CLOCK_FINAL_SECONDS
+            if self.frame_remaining <= FINAL_PHASE_SECONDS
+            else SHOT_CLOCK_NORMAL_SECONDS
+        )
 
-        # Used to detect shot clock changes for triggering beeps
-        self._prev_shot_remaining = 0
+        # Start of the current shot run, and whole seconds counted since then
+        self._run_start_ns = 0
+        self._seconds_consumed = 0
 
-    def _current_shot_length(self) -> int:
-        """
-        Decide shot length based on remaining frame time:
-        - last 5 minutes => 10 seconds
-        - otherwise      => 15 seconds
-        """
-        if self.frame_remaining <= FINAL_PHASE_SECONDS:
-            return SHOT_CLOCK_FINAL_SECONDS
-        return SHOT_CLOCK_NORMAL_SECONDS
+        # Whole seconds left before the run auto-stops (whichever timer hits 0 first).
+        # Set when a run starts so tick() needs no per-timer clamping.
+        self._seconds_to_stop = 0
 
     def toggle_run(self) -> None:
         """
@@ -210,92 +366,119 @@ class FrameController:
         if self.frame_remaining <= 0:
             self.running = False
             self.shot_remaining = 0
-            self._accum = 0.0
-            self._prev_shot_remaining = 0
+            self._seconds_to_stop = 0
             return
 
         # If currently running -> pause and reset shot clock
         if self.running:
             self.running = False
             self.shot_remaining = 0
-            self._accum = 0.0
-            self._prev_shot_remaining = 0
+            self._seconds_to_stop = 0
             return
 
         # Start a new shot run
         self.running = True
-        self.shot_remaining = self._current_shot_length()
-        self._prev_shot_remaining = self.shot_remaining
-        self._last_tick = time.monotonic()
-        self._accum = 0.0
+        self.shot_remaining = self._shot_length
+        self._seconds_to_stop = min(self.frame_remaining, self.shot_remaining)
+        self._run_start_ns = time.monotonic_ns()
+        self._seconds_consumed = 0
 
-    def update(self) -> None:
+    def tick(self) -> bool:
         """
-        Called every frame from the main loop.
+        Called on each TICK_EVENT while a shot run is active.
         Only decrements timers when running == True.
+        Returns True if the displayed timers changed (the screen needs a redraw).
 
-        Uses fractional accumulation so countdown continues correctly at high FPS.
+        Ticks arrive close to whole-second boundaries (slightly early or late),
+        so the elapsed run time is rounded to the nearest second.
         """
-        now = time.monotonic()
-        dt = now - self._last_tick
-        self._last_tick = now
-
         if not self.running:
-            return
+            return False
 
-        # Accumulate dt until we have at least one whole second to consume
-        self._accum += dt
-        dec = int(self._accum)
+        elapsed = (time.monotonic_ns() - self._run_start_ns + NS_PER_SECOND // 2) // NS_PER_SECOND
+        dec = elapsed - self._seconds_consumed
         if dec <= 0:
-            return
-        self._accum -= dec
-
-        # Decrement both timers by whole seconds
-        self.frame_remaining = max(0, self.frame_remaining - dec)
-        self.shot_remaining = max(0, self.shot_remaining - dec)
-
-        # If we crossed into final 5 minutes during a run, clamp the shot to 10 seconds.
-        # This avoids a 15s shot continuing in the final phase.
-        if self.frame_remaining <= FINAL_PHASE_SECONDS and self.shot_remaining > SHOT_CLOCK_FINAL_SECONDS:
-            self.shot_remaining = SHOT_CLOCK_FINAL_SECONDS
+            return False
+        self._seconds_consumed += dec
+
+        # Decrement both timers by whole seconds, saturating at the auto-stop point
+        # (both timers tick together, so neither can go below 0 before then)
+        if dec > self._seconds_to_stop:
+            dec = self._seconds_to_stop
+        self.frame_remaining -= dec
+        self.shot_remaining -= dec
+        self._seconds_to_stop -= dec
+
+        # Crossing into the final 5 minutes: later shots are 10 seconds, and a
+        # running 15s shot is clamped to 10 seconds rather than continuing.
+        if self._shot_length != SHOT_CLOCK_FINAL_SECONDS and self.frame_remaining <= FINAL_PHASE_SECONDS:
+            self._shot_length = SHOT_CLOCK_FINAL_SECONDS
+            if self.shot_remaining > SHOT_CLOCK_FINAL_SECONDS:
+                self.shot_remaining = SHOT_CLOCK_FINAL_SECONDS
+                self._seconds_to_stop = min(self.frame_remaining, self.shot_remaining)
 
         # Auto-stop when either timer hits 0
-        if self.frame_remaining == 0 or self.shot_remaining == 0:
+        if self._seconds_to_stop == 0:
             self.running = False
-            self._accum = 0.0
-
-    def shot_changed(self):
-        """
-        Returns (prev, cur) once per shot_remaining change.
-        Used to trigger beeps at 5..1 and the final long beep at 0.
-        """
-        cur = self.shot_remaining
-        prev = self._prev_shot_remaining
-        if cur != prev:
-            self._prev_shot_remaining = cur
-            return prev, cur
-        return None
+        return True
 
 
 # ============================================================
 # MAIN UI APPLICATION (pygame)
 # - Initializes pygame + fonts + audio
-# - Holds "MENU" and "FRAME" screens
+# - Holds the MENU and FRAME screens (STATE_MENU / STATE_FRAME)
 # - Routes input and calls draw/update methods
 # ============================================================
 
+# Screen states (SpeedSnookerUI.state); plain ints so the per-event and
+# per-frame state checks are single integer compares
+STATE_MENU, STATE_FRAME = 0, 1
+
+# Fires every second while a shot run is active (FrameController.tick).
+# The countdown beeps are played from the same event.
+TICK_EVENT = pygame.USEREVENT
+
+# Event types and keys used on the input path, bound once so handle_event()
+# compares plain module globals instead of looking them up on pygame
+_QUIT = pygame.QUIT
+_KEYDOWN = pygame.KEYDOWN
+_VIDEOEXPOSE = pygame.VIDEOEXPOSE
+_K_ESCAPE = pygame.K_ESCAPE
+_K_UP = frozenset((pygame.K_UP, pygame.K_w))
+_K_DOWN = frozenset((pygame.K_DOWN, pygame.K_s))
+_K_ENTER = frozenset((pygame.K_RETURN, pygame.K_KP_ENTER))
+_K_BACK = frozenset((pygame.K_BACKSPACE, pygame.K_DELETE))
+
+# The only event types handle_event() acts on; SDL drops all others
+# (mouse motion, window focus, ...) before they reach the queue.
+WATCHED_EVENTS = (_QUIT, _KEYDOWN, _VIDEOEXPOSE, TICK_EVENT)
+
+# FRAME screen footer, keyed by FrameController.running
+STATUS_LINES = {
+    running: f"{status}   |   FOB START/STOP   |   BACKSPACE MENU   |   ESC QUIT"
+    for running, status in ((True, "RUNNING"), (False, "PAUSED"))
+}
+
+
 class SpeedSnookerUI:
     def __init__(self) -> None:
         # Initialize mixer before pygame.init() for best compatibility
         if AUDIO_ENABLED:
-            pygame.mixer.pre_init(frequency=SAMPLE_RATE, size=-16, channels=1, buffer=512)
+            pygame.mixer.pre_init(frequency=SAMPLE_RATE, size=MIXER_SIZE, channels=1, buffer=MIXER_BUFFER)
 
         pygame.init()
         pygame.display.set_caption("Speed Snooker")
 
-        # Fullscreen window
-        self.screen = pygame.display.set_mode(RESOLUTION, pygame.FULLSCREEN)
-        self.clock = pygame.time.Clock()
+        # Fullscreen window. Deliberately not SCALED: pygame presents a SCALED
+        # display by uploading the whole texture on every update, which would
+        # throw away the dirty-rect updates. vsync explicitly off: only a few
+        # small rects change once a second, so there is nothing to tear, and
+        # display updates should never block waiting for vblank.
+        self.screen = pygame.display.set_mode(RESOLUTION, pygame.FULLSCREEN, vsync=0)
+
+        # Only queue the events the UI handles, so nothing else wakes the loop
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(WATCHED_EVENTS)
 
         # Fonts control the visual "size" of the clocks and headings
         self.fonts = {
@@ -307,23 +490,122 @@ class SpeedSnookerUI:
         }
 
         # Screen state machine
-        self.state = "MENU"
+        self.state = STATE_MENU
         self.selected_index = 0
         self.frame: Optional[FrameController] = None
 
-        # Precompute menu button rectangles
-        self.buttons = self._build_menu_buttons()
+        # Precompute menu button rectangles, stored as parallel arrays
+        # (index i = one button) so the draw/input paths index flat sequences
+        buttons = self._build_menu_buttons()
+        self.button_rects = [btn.rect for btn in buttons]
+        self.button_labels = tuple(btn.label for btn in buttons)
+        self.button_seconds = tuple(btn.seconds for btn in buttons)
+        # Each button pre-rendered once per style; drawing is then a single blit
+        self.button_surfs = [self._render_button(i, selected=False) for i in range(len(buttons))]
+        self.button_surfs_selected = [self._render_button(i, selected=True) for i in range(len(buttons))]
+        self._menu_bg_surf = self._build_menu_background()
+
+        # Dirty-rect bookkeeping: what is currently on screen.
+        # _dirty is set by events that can change the screen (keys, ticks,
+        # expose); wakeups that leave it clear skip drawing altogether.
+        # _full_redraw forces a complete repaint (startup, screen changes, expose).
+        self._dirty = True
+        self._full_redraw = True
+        self._drawn_index = -1
+        self._drawn_frame_key = None
+
+        # Frame clock digits as pre-rendered glyph tiles, one tile set per colour
+        # the clock can be drawn in (see render_glyph_tiles / layout_glyphs).
+        # Keyed by "time left?" so drawing picks the colour without a COLORS lookup.
+        self._timer_glyphs = {
+            True: render_glyph_tiles(self.fonts["timer"], COLORS["accent"]),
+            False: render_glyph_tiles(self.fonts["timer"], COLORS["fg"]),
+        }
+        # The shot clock only ever shows 00..15: pre-render each value once,
+        # already in its colour, and index the list by the seconds shown
+        self._shot_atlas = self._build_shot_atlas()
+
+        # FRAME screen layout: static background plus one fixed rect per
+        # changing element, sized for its widest possible contents
+        self._frame_bg_surf = self._build_frame_background()
+        self._timer_rect = self._fixed_text_rect(
+            self._timer_glyphs[True], "00:00", (RESOLUTION[0] // 2, RESOLUTION[1] // 2 - 40)
+        )
+        self._shot_rect = pygame.Rect(
+            0,
+            0,
+            max(surf.get_width() for surf in self._shot_atlas),
+            max(surf.get_height() for surf in self._shot_atlas),
+        )
+        self._shot_rect.center = (RESOLUTION[0] // 2, RESOLUTION[1] // 2 + 240)
+        # Both status lines pre-rendered, keyed like STATUS_LINES by running
+        self._status_surfs = {
+            running: render_text(self.fonts["hint"], line, COLORS["dim"])
+            for running, line in STATUS_LINES.items()
+        }
+        self._status_rect = pygame.Rect(
+            0,
+            0,
+            max(surf.get_width() for surf in self._status_surfs.values()),
+            max(surf.get_height() for surf in self._status_surfs.values()),
+        )
+        self._status_rect.center = (RESOLUTION[0] // 2, RESOLUTION[1] - 70)
+
+        # Every value each changing element can show, laid out once as
+        # (blits, rect) (see layout_glyphs), so draw_frame() never measures or
+        # positions anything. Same order as the (frame, shot, running) draw key.
+        timer_center = self._timer_rect.center
+        self._frame_layouts = (
+            [layout_glyphs(self._timer_glyphs[n > 0], text, timer_center) for n, text in enumerate(FMT_TIME)],
+            [layout_centered(surf, self._shot_rect.center) for surf in self._shot_atlas],
+            {
+                running: layout_centered(surf, self._status_rect.center)
+                for running, surf in self._status_surfs.items()
+            },
+        )
+        # Area each element actually covers on screen right now (within its
+        # fixed rect): restored before the element is redrawn, and unioned
+        # with the new area to form the rect pushed to the display
+        self._drawn_rects = [self._timer_rect.copy(), self._shot_rect.copy(), self._status_rect.copy()]
+
+        # KEYDOWN dispatch: (state, key) -> handler, one flat lookup per event.
+        # Keys are matched first; the fob has no keycode, so it is looked up
+        # by (state, scancode).
+        self._key_handlers = {
+            **{(STATE_MENU, key): self._menu_prev for key in _K_UP},
+            **{(STATE_MENU, key): self._menu_next for key in _K_DOWN},
+            **{(STATE_MENU, key): self._menu_select for key in _K_ENTER},
+            **{(STATE_FRAME, key): self.back_to_menu for key in _K_BACK},
+        }
+        self._scancode_handlers = {
+            (STATE_FRAME, FOB_SCANCODE): self._toggle_run,
+        }
+        # When the fob last toggled a run (for FOB_DEBOUNCE_NS)
+        self._last_fob_ns = -FOB_DEBOUNCE_NS
 
-        # Generate beep sounds (or disable if something fails)
+        # Wrap the pre-rendered beep PCM as sounds (or disable if something fails)
         self.beep_short: Optional[pygame.mixer.Sound] = None
-        self.beep_long: Optional[pygame.mixer.Sound] = None
+        # Long beep sounds are only built when first played (see _get_long_beep)
+        self.beep_long_loop: Optional[pygame.mixer.Sound] = None
+        self.beep_long_tail: Optional[pygame.mixer.Sound] = None
+        self.beep_long_channel: Optional[pygame.mixer.Channel] = None
         if AUDIO_ENABLED:
             try:
-                self.beep_short = make_tone_sound(BEEP_FREQ_HZ, BEEP_SHORT_MS, BEEP_VOLUME)
-                self.beep_long = make_tone_sound(BEEP_FREQ_HZ, BEEP_LONG_MS, BEEP_VOLUME)
+                self.beep_short = pygame.mixer.Sound(buffer=_BEEP_SHORT_PCM)
+                # Channel 0 is kept for the long beep (short beeps use the others),
+                # so its queued tail can't be displaced
+                pygame.mixer.set_reserved(1)
+                self.beep_long_channel = pygame.mixer.Channel(0)
             except Exception:
                 self.beep_short = None
-                self.beep_long = None
+                self.beep_long_channel = None
+
+        # Beep hooks, bound once: straight to Sound.play, or no-ops without
+        # audio, so the tick path never checks whether sound is available
+        if self.beep_short is None:
+            self._play_short = self._play_long = _no_sound
+        else:
+            self._play_short = self.beep_short.play
 
     def _build_menu_buttons(self):
         """
@@ -350,193 +632,320 @@ class SpeedSnookerUI:
         Frame loads PAUSED; timers do not start until SPACE.
         """
         self.frame = FrameController(seconds)
-        self.state = "FRAME"
+        self.state = STATE_FRAME
+        self._full_redraw = True
 
     def back_to_menu(self) -> None:
         """
         Transition from FRAME back to MENU.
         """
-        self.state = "MENU"
+        self.state = STATE_MENU
         self.selected_index = 0
         self.frame = None
+        self._full_redraw = True
+        pygame.time.set_timer(TICK_EVENT, 0)
+
+    # ---- Key handlers (see _key_handlers) ----
+    def _menu_prev(self) -> None:
+        self.selected_index = (self.selected_index - 1) % len(self.button_rects)
+
+    def _menu_next(self) -> None:
+        self.selected_index = (self.selected_index + 1) % len(self.button_rects)
+
+    def _menu_select(self) -> None:
+        self.load_frame_paused(self.button_seconds[self.selected_index])
+
+    def _toggle_run(self) -> None:
+        now = time.monotonic_ns()
+        if now - self._last_fob_ns < FOB_DEBOUNCE_NS:
+            return
+        self._last_fob_ns = now
+
+        if self.frame:
+            self.frame.toggle_run()
+            # Count down from this moment: (re)start the 1 Hz tick, or stop it
+            pygame.time.set_timer(TICK_EVENT, 1000 if self.frame.running else 0)
 
     # ---- Audio wrappers ----
-    def _play_short(self) -> None:
-        if self.beep_short:
-            self.beep_short.play()
+    # (_play_short is bound in __init__; both are replaced by _no_sound without audio)
+    def _get_long_beep(self):
+        """
+        Return the long beep's (loop, tail) sounds, building them on first use.
+        A shot may never run down to 0, so this is kept off the startup path.
+        """
+        if self.beep_long_loop is None:
+            loop_pcm, tail_pcm = render_long_beep_pcm()
+            self.beep_long_loop = pygame.mixer.Sound(buffer=loop_pcm)
+            self.beep_long_tail = pygame.mixer.Sound(buffer=tail_pcm)
+        return self.beep_long_loop, self.beep_long_tail
 
     def _play_long(self) -> None:
-        if self.beep_long:
-            self.beep_long.play()
+        # Fade in, repeat the loop, then the faded tail: BEEP_LONG_MS in total
+        loop, tail = self._get_long_beep()
+        self.beep_long_channel.play(loop, loops=BEEP_LONG_SEGMENTS - 2, fade_ms=BEEP_LONG_FADE_IN_MS)
+        self.beep_long_channel.queue(tail)
 
     def handle_event(self, event) -> None:
         """
         Central event handler.
         Routes input based on current state.
         """
-        if event.type == pygame.QUIT:
+        etype = event.type
+        if etype == _QUIT:
+            raise SystemExit
+
+        # Window contents were lost (e.g. uncovered); repaint everything
+        if etype == _VIDEOEXPOSE:
+            self._full_redraw = True
+            self._dirty = True
+
+        # One second of an active shot run has elapsed
+        if etype == TICK_EVENT:
+            if self.frame:
+                if self.frame.tick():
+                    # Countdown beeps as the shot clock reaches 5..1 (short) and 0 (long)
+                    shot = self.frame.shot_remaining
+                    if 1 <= shot <= BEEP_COUNTDOWN_FROM:
+                        self._play_short()
+                    elif shot == 0:
+                        self._play_long()
+                    self._dirty = True
+                if not self.frame.running:
+                    pygame.time.set_timer(TICK_EVENT, 0)  # auto-stopped
+            return
+
+        if etype != _KEYDOWN:
+            return
+
+        # Global quit
+        key = event.key
+        if key == _K_ESCAPE:
             raise SystemExit
 
-        if event.type == pygame.KEYDOWN:
-            # Global quit
-            if event.key == pygame.K_ESCAPE:
-                raise SystemExit
-
-            # MENU controls
-            if self.state == "MENU":
-                if event.key in (pygame.K_UP, pygame.K_w):
-                    self.selected_index = (self.selected_index - 1) % len(self.buttons)
-                elif event.key in (pygame.K_DOWN, pygame.K_s):
-                    self.selected_index = (self.selected_index + 1) % len(self.buttons)
-                elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
-                    self.load_frame_paused(self.buttons[self.selected_index].seconds)
-
-            # FRAME controls
-            elif self.state == "FRAME":
-                if event.key in (pygame.K_BACKSPACE, pygame.K_DELETE):
-                    self.back_to_menu()
-                elif getattr(event, "scancode", None) == 128:  # fob start/stop
-                    self.frame.toggle_run()
-
-    def draw_menu(self) -> None:
+        # Per-state controls: keycode first, then the fob's scancode
+        handler = self._key_handlers.get((self.state, key))
+        if handler is None:
+            # Synthetic KEYDOWNs (event.post) may carry no scancode at all
+            handler = self._scancode_handlers.get((self.state, getattr(event, "scancode", None)))
+        if handler is not None:
+            handler()
+            self._dirty = True
+
+    def _render_button(self, index: int, selected: bool) -> pygame.Surface:
+        """
+        Render one menu button in its selected/unselected style onto its own
+        button-sized surface (transparent outside the rounded corners).
+        """
+        rect = self.button_rects[index]
+        border = COLORS["accent"] if selected else COLORS["dim"]
+        fill = (22, 22, 22) if selected else COLORS["panel"]
+
+        surf = pygame.Surface(rect.size, pygame.SRCALPHA).convert_alpha()
+        local = surf.get_rect()
+        pygame.draw.rect(surf, fill, local, border_radius=18)
+        pygame.draw.rect(surf, border, local, width=6, border_radius=18)
+
+        draw_centered_text(
+            surf,
+            self.fonts["button"],
+            self.button_labels[index],
+            local.center,
+            COLORS["fg"] if selected else COLORS["dim"],
+        )
+        return surf
+
+    def _build_menu_background(self) -> pygame.Surface:
         """
-        Render the menu screen (title + selectable time buttons).
+        Pre-render the static parts of the menu once: background, title,
+        footer hint and every button in its unselected style.
+        draw_menu() blits this and only overlays the selected button.
         """
-        self.screen.fill(COLORS["bg"])
+        surf = pygame.Surface(RESOLUTION).convert()
+        surf.fill(COLORS["bg"])
 
         draw_centered_text(
-            self.screen,
+            surf,
             self.fonts["title"],
             "SPEED SNOOKER",
             (RESOLUTION[0] // 2, 160),
             COLORS["fg"],
         )
 
-        for i, btn in enumerate(self.buttons):
-            selected = (i == self.selected_index)
-            border = COLORS["accent"] if selected else COLORS["dim"]
-            fill = (22, 22, 22) if selected else COLORS["panel"]
-
-            pygame.draw.rect(self.screen, fill, btn.rect, border_radius=18)
-            pygame.draw.rect(self.screen, border, btn.rect, width=6, border_radius=18)
-
-            draw_centered_text(
-                self.screen,
-                self.fonts["button"],
-                btn.label,
-                btn.rect.center,
-                COLORS["fg"] if selected else COLORS["dim"],
-            )
+        for img, rect in zip(self.button_surfs, self.button_rects):
+            surf.blit(img, rect)
 
         draw_centered_text(
-            self.screen,
+            surf,
             self.fonts["hint"],
             "UP/DOWN + ENTER   |   ESC QUIT",
             (RESOLUTION[0] // 2, RESOLUTION[1] - 70),
             COLORS["dim"],
         )
+        return surf
 
-    def draw_frame(self) -> None:
+    def _build_shot_atlas(self) -> list:
         """
-        Render the frame screen:
-        - Title
-        - Main frame clock (MM:SS)
-        - Shot clock (SS)
-        - Status/controls
+        Render every shot clock value (0..longest shot) as "SS" in the colour
+        it is displayed in: red for the last 5 seconds, dim at 0.
+        """
+        atlas = []
+        for n in range(max(SHOT_CLOCK_NORMAL_SECONDS, SHOT_CLOCK_FINAL_SECONDS) + 1):
+            # Shot timer color logic: red for last 5 seconds
+            color = (
+                COLORS["shot_critical"]
+                if 1 <= n <= 5
+                else (COLORS["shot"] if n > 0 else COLORS["dim"])
+            )
+            atlas.append(self.fonts["shot"].render(f"{n:02d}", True, color).convert_alpha())
+        return atlas
+
+    @staticmethod
+    def _fixed_text_rect(tiles, pattern, center) -> pygame.Rect:
+        """
+        Rect centered at (x, y) that fits any clock string shaped like pattern
+        ("0" = any digit), whichever digits are shown.
         """
-        self.screen.fill(COLORS["bg"])
+        digit_w = max(tiles[ch].get_width() for ch in "0123456789")
+        width = sum(digit_w if ch == "0" else tiles[ch].get_width() for ch in pattern)
+        rect = pygame.Rect(0, 0, width, max(t.get_height() for t in tiles.values()))
+        rect.center = center
+        return rect
 
-        frame_remaining = self.frame.frame_remaining if self.frame else 0
-        shot_remaining = self.frame.shot_remaining if self.frame else 0
-        running = self.frame.running if self.frame else False
+    def _build_frame_background(self) -> pygame.Surface:
+        """
+        Pre-render the static parts of the frame screen once: background,
+        title and the shot clock label. draw_frame() restores changed
+        regions from this before redrawing them.
+        """
+        surf = pygame.Surface(RESOLUTION).convert()
+        surf.fill(COLORS["bg"])
 
         # Title
         draw_centered_text(
-            self.screen,
+            surf,
             self.fonts["title"],
             "FRAME TIMER",
             (RESOLUTION[0] // 2, 140),
             COLORS["fg"],
         )
 
-        # Main frame timer (position controls where it appears)
-        draw_centered_text(
-            self.screen,
-            self.fonts["timer"],
-            fmt_time(frame_remaining),
-            (RESOLUTION[0] // 2, RESOLUTION[1] // 2 - 40),
-            COLORS["accent"] if frame_remaining > 0 else COLORS["fg"],
-        )
-
         # Shot label
         draw_centered_text(
-            self.screen,
+            surf,
             self.fonts["hint"],
             "SHOT CLOCK",
             (RESOLUTION[0] // 2, RESOLUTION[1] // 2 + 150),
             COLORS["dim"],
         )
+        return surf
 
-        # Shot timer color logic: red for last 5 seconds
-        shot_color = (
-            COLORS["shot_critical"]
-            if 1 <= shot_remaining <= 5
-            else (COLORS["shot"] if shot_remaining > 0 else COLORS["dim"])
-        )
+    def draw_menu(self) -> list:
+        """
+        Render the menu screen (pre-baked background + selected button).
 
-        # Shot clock display
-        draw_centered_text(
-            self.screen,
-            self.fonts["shot"],
-            f"{shot_remaining:02d}",
-            (RESOLUTION[0] // 2, RESOLUTION[1] // 2 + 240),
-            shot_color,
-        )
+        Returns the list of rects that changed:
+        - full repaint: the whole screen
+        - selection moved: just the old and new button
+        - nothing changed: [] (no drawing at all)
+        """
+        if not self._full_redraw:
+            if self._drawn_index == self.selected_index:
+                return []
+            # Restore the old button from the background, highlight the new one
+            old_rect = self.button_rects[self._drawn_index]
+            new_rect = self.button_rects[self.selected_index]
+            self.screen.blit(self._menu_bg_surf, old_rect, old_rect)
+            self.screen.blit(self.button_surfs_selected[self.selected_index], new_rect)
+            self._drawn_index = self.selected_index
+            return [old_rect, new_rect]
+
+        self.screen.blit(self._menu_bg_surf, (0, 0))
+        self.screen.blit(self.button_surfs_selected[self.selected_index], self.button_rects[self.selected_index])
+
+        self._full_redraw = False
+        self._drawn_index = self.selected_index
+        return [self.screen.get_rect()]
+
+    def draw_frame(self) -> list:
+        """
+        Render the frame screen:
+        - Title
+        - Main frame clock (MM:SS)
+        - Shot clock (SS)
+        - Status/controls
 
-        # Status line
-        status = "RUNNING" if running else "PAUSED"
-        draw_centered_text(
-            self.screen,
-            self.fonts["hint"],
-            f"{status}   |   FOB START/STOP   |   BACKSPACE MENU   |   ESC QUIT",
-            (RESOLUTION[0] // 2, RESOLUTION[1] - 70),
-            COLORS["dim"],
-        )
+        The visible state only changes once per second, so drawing is skipped
+        (and [] returned) while (frame, shot, running) matches what is on screen.
+        Otherwise only the elements whose value changed are restored from the
+        pre-baked background and redrawn; for each, the union of its old and
+        new on-screen area is returned.
+        """
+        frame_remaining = self.frame.frame_remaining if self.frame else 0
+        shot_remaining = self.frame.shot_remaining if self.frame else 0
+        running = self.frame.running if self.frame else False
+
+        key = (frame_remaining, shot_remaining, running)
+        full = self._full_redraw
+        if not full and key == self._drawn_frame_key:
+            return []
+        prev = (None, None, None) if full else self._drawn_frame_key
+        self._full_redraw = False
+        self._drawn_frame_key = key
+
+        # All blits for this redraw go to the screen in one Surface.blits() call
+        bg = self._frame_bg_surf
+        batch = [(bg, (0, 0))] if full else []
+        dirty = []
+
+        # Per element (frame timer, shot clock, status line) whose value changed:
+        # restore its old area from the background, then blit the new value's
+        # pre-laid-out tiles. The shot clock's area overlaps the label, which
+        # the restore brings back.
+        drawn = self._drawn_rects
+        for i, layouts in enumerate(self._frame_layouts):
+            value = key[i]
+            if value == prev[i]:
+                continue
+            blits, rect = layouts[value]
+            old = drawn[i]
+            if not full:
+                batch.append((bg, old, old))
+            batch.extend(blits)
+            dirty.append(rect.union(old))
+            drawn[i] = rect
+
+        self.screen.blits(batch, doreturn=False)
+        return [self.screen.get_rect()] if full else dirty
 
     def run(self) -> None:
         """
         Main loop:
-        - Process input events
-        - Update timers
-        - Trigger audio based on shot countdown changes
-        - Draw current screen
+        - Sleep until an input event or a TICK_EVENT arrives
+        - Process events (TICK_EVENT updates the timers and plays the beeps)
+        - Draw current screen (only when dirty), pushing only the changed rects
         """
         while True:
-            # Event handling
-            for event in pygame.event.get():
-                self.handle_event(event)
-
-            # Timer update + audio triggering only on FRAME screen
-            if self.state == "FRAME" and self.frame:
-                self.frame.update()
-                changed = self.frame.shot_changed()
-                if changed:
-                    prev, cur = changed
-                    # Beep in last 5 seconds (5..1)
-                    if 1 <= cur <= 5:
-                        self._play_short()
-                    # Long beep at 0 (end of shot)
-                    elif cur == 0 and prev > 0:
-                        self._play_long()
-
-            # Render
-            if self.state == "MENU":
-                self.draw_menu()
-            elif self.state == "FRAME":
-                self.draw_frame()
-
-            pygame.display.flip()
-            self.clock.tick(FPS)
+            # Event handling: block in the kernel instead of spinning at a fixed FPS.
+            # wait() has just pumped SDL, so drain the rest of the queue in one
+            # batch without pumping again (usually it is empty: peek first).
+            self.handle_event(pygame.event.wait())
+            if pygame.event.peek(WATCHED_EVENTS, pump=False):
+                for event in pygame.event.get(WATCHED_EVENTS, pump=False):
+                    self.handle_event(event)
+
+            # Render, only if an event may have changed what is on screen
+            if not self._dirty:
+                continue
+            self._dirty = False
+
+            dirty = []
+            if self.state == STATE_MENU:
+                dirty = self.draw_menu()
+            elif self.state == STATE_FRAME:
+                dirty = self.draw_frame()
+
+            if dirty:
+                pygame.display.update(dirty)
 
 
 # ============================================================
@@ -1,16 +1,16 @@
 # ============================================================
 # Imports
-# - Standard library: system exit, timing, math, raw audio buffer helpers
+# - Standard library: system exit, timing
 # - Dataclasses/typing: simple structured data + type hints
+# - NumPy: vectorised tone synthesis
 # - pygame: windowing, input, rendering, audio output
 # ============================================================
 import sys
 import time
-import math
-from array import array
 from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
 import pygame
 
 
@@ -44,6 +44,7 @@ SHOT_CLOCK_FINAL_SECONDS = 10
 # Audio configuration: generate two beep sounds (short + long) at startup.
 AUDIO_ENABLED = True
 SAMPLE_RATE = 44100
+MIXER_BUFFER = 2048  # ~46 ms at 44.1 kHz; 512 (~12 ms) can underrun on a busy Pi
 BEEP_FREQ_HZ = 880
 BEEP_SHORT_MS = 120
 BEEP_LONG_MS = 3000
@@ -93,24 +94,20 @@ def make_tone_sound(freq_hz: int, duration_ms: int, volume: float) -> pygame.mix
     """
     n_samples = int(SAMPLE_RATE * (duration_ms / 1000.0))
     amp = int(32767 * max(0.0, min(1.0, volume)))
-    buf = array("h")  # signed 16-bit samples
-    step = (2.0 * math.pi * freq_hz) / SAMPLE_RATE
+    step = (2.0 * np.pi * freq_hz) / SAMPLE_RATE
 
-    fade = min(200, n_samples // 10)  # fade length in samples
-    for i in range(n_samples):
-        v = math.sin(step * i)
-        sample = int(amp * v)
-
-        # Apply fade-in / fade-out envelope
-        if fade > 0:
-            if i < fade:
-                sample = int(sample * (i / fade))
-            elif i > n_samples - fade:
-                sample = int(sample * ((n_samples - i) / fade))
+    # Whole waveform in one vectorised expression (no per-sample Python loop)
+    wave = np.sin(step * np.arange(n_samples))
 
-        buf.append(sample)
+    # Fade-in / fade-out envelope
+    fade = min(200, n_samples // 10)  # fade length in samples
+    envelope = np.ones(n_samples, dtype=np.float32)
+    if fade > 0:
+        envelope[:fade] = np.linspace(0.0, 1.0, fade, endpoint=False)
+        envelope[-fade:] = np.linspace(1.0, 0.0, fade, endpoint=False)
 
-    return pygame.mixer.Sound(buffer=buf.tobytes())
+    samples = (amp * wave * envelope).astype(np.int16)  # signed 16-bit samples
+    return pygame.mixer.Sound(buffer=samples.tobytes())
 
 
 # ============================================================
@@ -247,7 +244,7 @@ class SpeedSnookerUI:
         # Pre-init mixer to control sample format before pygame.init()
         self.audio_ok = False
         if AUDIO_ENABLED:
-            pygame.mixer.pre_init(frequency=SAMPLE_RATE, size=-16, channels=1, buffer=512)
+            pygame.mixer.pre_init(frequency=SAMPLE_RATE, size=-16, channels=1, buffer=MIXER_BUFFER)
 
         pygame.init()
         pygame.display.set_caption("Speed Snooker")
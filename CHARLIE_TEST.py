@@ -5,10 +5,10 @@ import os
 import sys
 import time
 import math
-from array import array
 from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
 import pygame
 
 
@@ -78,27 +78,21 @@ def make_tone_sound(freq_hz: int, duration_ms: int, volume: float) -> pygame.mix
     """
     n_samples = int(SAMPLE_RATE * (duration_ms / 1000.0))
     amp = int(32767 * max(0.0, min(1.0, volume)))
-    mono = array("h")
     step = (2.0 * math.pi * freq_hz) / SAMPLE_RATE
 
+    # Vectorized sine: one np.sin over all samples instead of a Python loop
+    wave = np.sin(step * np.arange(n_samples))
+
     fade = min(200, n_samples // 10)
-    for i in range(n_samples):
-        v = math.sin(step * i)
-        sample = int(amp * v)
-
-        if fade > 0:
-            if i < fade:
-                sample = int(sample * (i / fade))
-            elif i > n_samples - fade:
-                sample = int(sample * ((n_samples - i) / fade))
-
-        mono.append(sample)
-
-    # Duplicate mono -> stereo (L, R)
-    stereo = array("h")
-    for s in mono:
-        stereo.append(s)
-        stereo.append(s)
+    env = np.ones(n_samples)
+    if fade > 0:
+        env[:fade] = np.arange(fade) / fade
+        env[n_samples - fade + 1:] = np.arange(fade - 1, 0, -1) / fade
+
+    samples = ((amp * wave).astype(np.int32) * env).astype(np.int16)
+
+    # Duplicate mono -> stereo (L, R): repeat each sample in place, interleaved
+    stereo = np.repeat(samples, 2)
 
     return pygame.mixer.Sound(buffer=stereo.tobytes())
 
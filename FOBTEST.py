@@ -7,30 +7,35 @@ import pygame
 # Exit with ESC.
 
 RESOLUTION = (800, 450)
-FPS = 60
 
 def main():
     pygame.init()
     pygame.display.set_caption("Input Debug Logger")
     screen = pygame.display.set_mode(RESOLUTION)  # windowed is better for debugging
-    clock = pygame.time.Clock()
     font = pygame.font.SysFont(None, 28)
 
-    lines = []
+    lines = []  # rendered log lines, converted to the display format once
+    dirty = True  # redraw only when the log changed (or the window was exposed)
 
     def add_line(s: str):
-        nonlocal lines
-        lines.append(s)
+        nonlocal lines, dirty
+        lines.append(font.render(s, True, (230, 230, 230)).convert_alpha())
         lines = lines[-18:]  # keep last lines
+        dirty = True
 
     add_line("Press fob buttons. Watch console + on-screen log. ESC quits.")
 
     running = True
     while running:
-        for event in pygame.event.get():
+        # Sleep until input arrives (nothing changes otherwise), then drain the queue
+        events = [pygame.event.wait()] + pygame.event.get(pump=False)
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
 
+            if event.type == pygame.VIDEOEXPOSE:
+                dirty = True
+
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     running = False
@@ -53,15 +58,17 @@ def main():
                 print(msg)
                 add_line(msg)
 
+        if not dirty:
+            continue
+
         screen.fill((15, 15, 15))
         y = 10
-        for s in lines:
-            img = font.render(s, True, (230, 230, 230))
+        for img in lines:
             screen.blit(img, (10, y))
             y += 24
 
         pygame.display.flip()
-        clock.tick(FPS)
+        dirty = False
 
     pygame.quit()
     sys.exit(0)